@@ -26,6 +26,10 @@ function corsHeaders() {
     'Access-Control-Allow-Methods': 'GET, OPTIONS',
     'Access-Control-Allow-Headers': 'Content-Type',
     'Content-Type': 'application/json',
+    // A reused copy would replay stale X-RateLimit-* headers into the
+    // client's quota tracking, and the client never refetches a URL it
+    // already holds, so there is nothing to revalidate.
+    'Cache-Control': 'no-store',
   };
 }
 
@@ -119,7 +123,13 @@ export async function onRequestGet(context) {
       );
     }
 
-    const data = await response.json();
+    // Pass Reddit's JSON through as-is. Parsing and re-serializing a full
+    // listing costs CPU on every request without changing the output.
+    const contentType = response.headers.get('content-type') || '';
+    if (!contentType.includes('json')) {
+      throw new Error(`Unexpected response type from Reddit: ${contentType || 'unknown'}`);
+    }
+    const body = await response.text();
 
     // Forward Reddit's rate limit headers so the client can track quota
     const responseHeaders = corsHeaders();
@@ -134,7 +144,7 @@ export async function onRequestGet(context) {
     // Expose these headers to client-side JS
     responseHeaders['Access-Control-Expose-Headers'] = 'X-RateLimit-Remaining, X-RateLimit-Reset, X-RateLimit-Used';
 
-    return new Response(JSON.stringify(data), {
+    return new Response(body, {
       status: 200,
       headers: responseHeaders,
     });
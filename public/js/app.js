@@ -3,6 +3,45 @@
  * Client-side SPA orchestrator: routing, state, UI binding.
  */
 
+// Escaping by string replacement avoids creating a throwaway DOM node per
+// call, and also covers quotes for values placed inside attributes.
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+const HTML_ESCAPE_RE = /[&<>"']/g;
+
+// Common English and Reddit words excluded from frequency analysis.
+const STOPWORDS = new Set([
+  'the','be','to','of','and','a','in','that','have','i','it','for','not','on','with',
+  'he','as','you','do','at','this','but','his','by','from','they','we','her','she','or',
+  'an','will','my','one','all','would','there','their','what','so','up','out','if','about',
+  'who','get','which','go','me','when','make','can','like','time','no','just','him','know',
+  'take','people','into','year','your','good','some','could','them','see','other','than',
+  'then','now','look','only','come','its','over','think','also','back','after','use','two',
+  'how','our','work','first','well','way','even','new','want','because','any','these',
+  'give','day','most','us','been','has','had','was','were','are','is','am','im','dont',
+  'really','much','very','more','still','should','did','got','going','being','been','may',
+  'own','through','too','does','need','say','each','tell','why','ask','men','ran','try',
+  'every','where','between','never','another','while','last','might','found','before',
+  'same','made','long','right','said','many','thing','things','something','anything','man',
+  'woman','life','world','let','keep','being','down','over','such','against','here','both',
+  'those','put','went','came','off','around','since','still','set','few','without',
+  'already','sure','nothing','point','someone','everyone','everything','lot','feel',
+  'felt','actually','doing','done','went','thought','getting','making','big','put','old',
+  'great','around','little','part','every','again','change','went','says','http','https',
+  'www','com','reddit','removed','deleted',
+]);
+
+// Word tokenizer for frequency analysis: runs of a-z in lower-cased text.
+const WORD_RE = /[a-z]+/g;
+
+// Shared date formatters. toLocaleDateString() builds a new Intl.DateTimeFormat
+// on every call, which dominates table and chart rendering for large collections.
+const DATE_FORMATS = {
+  short: new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric' }),
+  full: new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric', year: 'numeric' }),
+  monthYear: new Intl.DateTimeFormat('en-US', { month: 'short', year: '2-digit' }),
+  dateTime: new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric', hour: '2-digit', minute: '2-digit' }),
+};
+
 const ThreshApp = {
   // --- State ---
   collections: [],       // Array of { id, posts, comments, config, timestamp }
@@ -75,21 +114,29 @@ const ThreshApp = {
 
   // --- Navigation ---
 
-  navigate(page) {
-    // Hide all pages
-    document.querySelectorAll('.page-section').forEach(s => s.classList.remove('active'));
+  _navCache: null,
+
+  /**
+   * Page sections and nav links are static markup, so query them once.
+   */
+  _navElements() {
+    if (!this._navCache) {
+      this._navCache = {
+        pages: document.querySelectorAll('.page-section'),
+        links: document.querySelectorAll('.sidebar-link, .mobile-nav-link'),
+      };
+    }
+    return this._navCache;
+  },
 
-    // Show target page
-    const target = document.getElementById(`page-${page}`);
-    if (target) target.classList.add('active');
+  navigate(page) {
+    const { pages, links } = this._navElements();
 
-    // Update sidebar
-    document.querySelectorAll('.sidebar-link').forEach(link => {
-      link.classList.toggle('active', link.dataset.page === page);
-    });
+    // Show target page, hide the rest
+    pages.forEach(s => s.classList.toggle('active', s.id === `page-${page}`));
 
-    // Update mobile nav
-    document.querySelectorAll('.mobile-nav-link').forEach(link => {
+    // Update sidebar and mobile nav
+    links.forEach(link => {
       link.classList.toggle('active', link.dataset.page === page);
     });
 
@@ -140,12 +187,32 @@ const ThreshApp = {
     submitBtn.disabled = true;
     statusEl.textContent = '';
 
+    // Concurrent fetches can report progress several times per frame; keep
+    // only the latest report and write it to the DOM once per frame.
+    const messageEl = document.getElementById('progress-message');
+    const countEl = document.getElementById('progress-count');
+    const barEl = document.getElementById('progress-bar');
+    let latestProgress = null;
+    let progressFrame = 0;
+    const paintProgress = () => {
+      progressFrame = 0;
+      const progress = latestProgress;
+      messageEl.textContent = progress.message;
+      countEl.textContent = `${progress.current} posts`;
+      const pct = progress.total > 0 ? Math.min(100, (progress.current / progress.total) * 100) : 0;
+      barEl.style.width = `${pct}%`;
+    };
+
     try {
       const result = await RedditClient.collect(config, (progress) => {
-        document.getElementById('progress-message').textContent = progress.message;
-        document.getElementById('progress-count').textContent = `${progress.current} posts`;
-        const pct = progress.total > 0 ? Math.min(100, (progress.current / progress.total) * 100) : 0;
-        document.getElementById('progress-bar').style.width = `${pct}%`;
+        latestProgress = progress;
+        if (!progressFrame) progressFrame = requestAnimationFrame(paintProgress);
+      }).finally(() => {
+        // Flush a report still waiting for its frame
+        if (progressFrame) {
+          cancelAnimationFrame(progressFrame);
+          paintProgress();
+        }
       });
 
       if (result.posts.length === 0) {
@@ -166,8 +233,8 @@ const ThreshApp = {
       this._updateSelectors();
 
       // Show success
-      document.getElementById('progress-bar').style.width = '100%';
-      document.getElementById('progress-message').textContent = 'Collection complete!';
+      barEl.style.width = '100%';
+      messageEl.textContent = 'Collection complete!';
       this.toast(`Collected ${result.posts.length} posts from r/${config.subreddit}`, 'success');
 
       // Navigate to harvest after brief delay
@@ -175,8 +242,8 @@ const ThreshApp = {
         progressEl.style.display = 'none';
         submitBtn.disabled = false;
         this.activeCollection = collection;
+        // navigate() renders Harvest for the active collection
         this.navigate('harvest');
-        this._renderHarvest();
       }, 1500);
 
     } catch (err) {
@@ -232,9 +299,7 @@ const ThreshApp = {
 
     // Stats
     const statsEl = document.getElementById('harvest-stats');
-    const avgScore = posts.length ? Math.round(posts.reduce((s, p) => s + p.score, 0) / posts.length) : 0;
-    const avgComments = posts.length ? Math.round(posts.reduce((s, p) => s + p.num_comments, 0) / posts.length) : 0;
-    const dateRange = posts.length ? this._dateRange(posts) : 'N/A';
+    const { avgScore, avgComments, dateRange } = this._computeStats(posts);
 
     statsEl.innerHTML = `
       <div class="stat-card"><div class="stat"><span class="stat-value">${posts.length}</span><span class="stat-label">Posts</span></div></div>
@@ -246,6 +311,23 @@ const ThreshApp = {
     this._renderHarvestTable();
   },
 
+  HARVEST_CHUNK_ROWS: 200,
+  _harvestRenderToken: 0,
+
+  // Lower-cased title/author/body per post, built on first filter so each
+  // keystroke doesn't re-lowercase every post body.
+  _searchTextCache: new WeakMap(),
+
+  _searchText(p) {
+    let text = this._searchTextCache.get(p);
+    if (text === undefined) {
+      // NUL separators keep a query from matching across fields
+      text = `${p.title}\0${p.author}\0${p.selftext || ''}`.toLowerCase();
+      this._searchTextCache.set(p, text);
+    }
+    return text;
+  },
+
   _renderHarvestTable() {
     if (!this.activeCollection) return;
 
@@ -254,11 +336,7 @@ const ThreshApp = {
     // Filter
     if (this.harvestFilter) {
       const q = this.harvestFilter.toLowerCase();
-      posts = posts.filter(p =>
-        p.title.toLowerCase().includes(q) ||
-        p.author.toLowerCase().includes(q) ||
-        (p.selftext && p.selftext.toLowerCase().includes(q))
-      );
+      posts = posts.filter(p => this._searchText(p).includes(q));
     }
 
     // Sort
@@ -275,9 +353,8 @@ const ThreshApp = {
     document.getElementById('harvest-count').textContent = `${posts.length} posts`;
 
     const tbody = document.getElementById('harvest-tbody');
-    tbody.innerHTML = posts.map(p => {
-      const date = new Date(p.created_utc * 1000);
-      const dateStr = date.toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' });
+    const renderRow = (p) => {
+      const dateStr = DATE_FORMATS.full.format(p.created_utc * 1000);
       const titleTrunc = p.title.length > 80 ? p.title.slice(0, 80) + '...' : p.title;
 
       return `<tr onclick="ThreshApp.showPostDetail('${p.id}')" style="cursor:pointer">
@@ -287,7 +364,26 @@ const ThreshApp = {
         <td style="text-align:right;">${p.num_comments.toLocaleString()}</td>
         <td class="text-ash text-xs" style="white-space:nowrap;">${dateStr}</td>
       </tr>`;
-    }).join('');
+    };
+
+    // Render in chunks, one per animation frame, so a large collection
+    // doesn't freeze the page while the table is built. A newer render
+    // (filter keystroke, sort click) supersedes any chunks still pending.
+    const token = ++this._harvestRenderToken;
+    const renderChunk = (start) => {
+      if (token !== this._harvestRenderToken) return;
+      const end = Math.min(start + this.HARVEST_CHUNK_ROWS, posts.length);
+      const html = posts.slice(start, end).map(renderRow).join('');
+      if (start === 0) {
+        tbody.innerHTML = html;
+      } else {
+        tbody.insertAdjacentHTML('beforeend', html);
+      }
+      if (end < posts.length) {
+        requestAnimationFrame(() => renderChunk(end));
+      }
+    };
+    renderChunk(0);
   },
 
   filterHarvest() {
@@ -305,9 +401,38 @@ const ThreshApp = {
     this._renderHarvestTable();
   },
 
+  // Posts by id per collection, so opening a post is a lookup, not a scan
+  _postIndexCache: new WeakMap(),
+
+  _postById(collection, postId) {
+    let index = this._postIndexCache.get(collection);
+    if (!index) {
+      index = new Map(collection.posts.map(p => [p.id, p]));
+      this._postIndexCache.set(collection, index);
+    }
+    return index.get(postId);
+  },
+
+  // Comments grouped by post_id per collection, built on first use
+  _commentsByPostCache: new WeakMap(),
+
+  _commentsByPost(collection) {
+    let groups = this._commentsByPostCache.get(collection);
+    if (!groups) {
+      groups = new Map();
+      for (const c of collection.comments || []) {
+        const list = groups.get(c.post_id);
+        if (list) list.push(c);
+        else groups.set(c.post_id, [c]);
+      }
+      this._commentsByPostCache.set(collection, groups);
+    }
+    return groups;
+  },
+
   showPostDetail(postId) {
     if (!this.activeCollection) return;
-    const post = this.activeCollection.posts.find(p => p.id === postId);
+    const post = this._postById(this.activeCollection, postId);
     if (!post) return;
 
     const detailEl = document.getElementById('post-detail');
@@ -322,11 +447,12 @@ const ThreshApp = {
 
     // Comments
     const commentsEl = document.getElementById('detail-comments');
-    if (post.fetched_comments && post.fetched_comments.length > 0) {
+    const postComments = this._commentsByPost(this.activeCollection).get(post.id);
+    if (postComments && postComments.length > 0) {
       commentsEl.innerHTML = `
-        <h5 style="margin-bottom:0.5rem;color:var(--bone-muted);">Comments (${post.fetched_comments.length})</h5>
+        <h5 style="margin-bottom:0.5rem;color:var(--bone-muted);">Comments (${postComments.length})</h5>
         <div class="comment-tree">
-          ${post.fetched_comments.map(c => `
+          ${postComments.map(c => `
             <div class="comment-item" style="margin-left:${c.depth * 1}rem;">
               <div class="comment-meta">
                 <span class="text-ember">${this._escapeHtml(c.author)}</span>
@@ -525,44 +651,7 @@ const ThreshApp = {
     if (!wrap) return;
 
     // Simple word frequency (client-side, no API needed)
-    const stopwords = new Set([
-      'the','be','to','of','and','a','in','that','have','i','it','for','not','on','with',
-      'he','as','you','do','at','this','but','his','by','from','they','we','her','she','or',
-      'an','will','my','one','all','would','there','their','what','so','up','out','if','about',
-      'who','get','which','go','me','when','make','can','like','time','no','just','him','know',
-      'take','people','into','year','your','good','some','could','them','see','other','than',
-      'then','now','look','only','come','its','over','think','also','back','after','use','two',
-      'how','our','work','first','well','way','even','new','want','because','any','these',
-      'give','day','most','us','been','has','had','was','were','are','is','am','im','dont',
-      'really','much','very','more','still','should','did','got','going','being','been','may',
-      'own','through','too','does','need','say','each','tell','why','ask','men','ran','try',
-      'every','where','between','never','another','while','last','might','found','before',
-      'same','made','long','right','said','many','thing','things','something','anything','man',
-      'woman','life','world','let','keep','being','down','over','such','against','here','both',
-      'those','put','went','came','off','around','since','still','set','few','without',
-      'already','sure','nothing','point','someone','everyone','everything','lot','feel',
-      'felt','actually','doing','done','went','thought','getting','making','big','put','old',
-      'great','around','little','part','every','again','change','went','says','http','https',
-      'www','com','reddit','removed','deleted',
-    ]);
-
-    const allText = this.activeCollection.posts
-      .map(p => `${p.title} ${p.selftext || ''}`)
-      .join(' ')
-      .toLowerCase();
-
-    const words = allText
-      .replace(/[^a-z\s]/g, ' ')
-      .split(/\s+/)
-      .filter(w => w.length > 2 && !stopwords.has(w));
-
-    const totalWords = words.length;
-    const freq = {};
-    words.forEach(w => { freq[w] = (freq[w] || 0) + 1; });
-
-    const sorted = Object.entries(freq)
-      .sort((a, b) => b[1] - a[1])
-      .slice(0, 20);
+    const { top: sorted, totalWords } = this._computeWordFreq(this.activeCollection.posts);
 
     this._wordFreqData = sorted;
 
@@ -631,6 +720,40 @@ const ThreshApp = {
 
   _temporalChart: null,
 
+  // Daily post counts per posts array, so revisiting Glean skips regrouping
+  _dailyCountsCache: new WeakMap(),
+
+  /**
+   * Posts per UTC day from the first to the last day, gaps filled with 0.
+   */
+  _dailyCounts(posts) {
+    let result = this._dailyCountsCache.get(posts);
+    if (result) return result;
+
+    // Group posts by UTC day number; integer buckets need no Date objects
+    const dayCounts = new Map();
+    let firstDay = Infinity;
+    let lastDay = -Infinity;
+    for (const p of posts) {
+      const day = Math.floor(p.created_utc / 86400);
+      dayCounts.set(day, (dayCounts.get(day) || 0) + 1);
+      if (day < firstDay) firstDay = day;
+      if (day > lastDay) lastDay = day;
+    }
+
+    // Fill in missing days with 0
+    const days = [];
+    const values = [];
+    for (let day = firstDay; day <= lastDay; day++) {
+      days.push(day);
+      values.push(dayCounts.get(day) || 0);
+    }
+
+    result = { firstDay, lastDay, days, values };
+    this._dailyCountsCache.set(posts, result);
+    return result;
+  },
+
   _renderTemporalChart() {
     const wrap = document.getElementById('temporal-chart-wrap');
     if (!wrap || !this.activeCollection) return;
@@ -643,32 +766,13 @@ const ThreshApp = {
     const posts = this.activeCollection.posts;
     if (!posts.length) return;
 
-    // Group posts by date
-    const dateCounts = {};
-    posts.forEach(p => {
-      const date = new Date(p.created_utc * 1000).toISOString().slice(0, 10);
-      dateCounts[date] = (dateCounts[date] || 0) + 1;
-    });
-
-    // Sort by date and fill gaps
-    const dates = Object.keys(dateCounts).sort();
-    if (dates.length < 2) {
+    const { firstDay, lastDay, days, values } = this._dailyCounts(posts);
+    if (lastDay === firstDay) {
       // Not enough date spread for a meaningful chart
       wrap.innerHTML = '<p class="text-ash text-sm" style="text-align:center;padding:2rem 0;">All posts from the same day — no temporal spread to chart.</p>';
       return;
     }
 
-    // Fill in missing dates with 0
-    const start = new Date(dates[0]);
-    const end = new Date(dates[dates.length - 1]);
-    const labels = [];
-    const values = [];
-    for (let d = new Date(start); d <= end; d.setDate(d.getDate() + 1)) {
-      const key = d.toISOString().slice(0, 10);
-      labels.push(key);
-      values.push(dateCounts[key] || 0);
-    }
-
     // Destroy previous chart if exists
     if (this._temporalChart) {
       this._temporalChart.destroy();
@@ -678,19 +782,19 @@ const ThreshApp = {
     wrap.innerHTML = '<canvas id="temporal-chart"></canvas>';
     const ctx = document.getElementById('temporal-chart').getContext('2d');
 
-    // Determine label format based on date range
-    const rangeDays = Math.round((end - start) / (1000 * 60 * 60 * 24));
-    const formatDate = (dateStr) => {
-      const d = new Date(dateStr + 'T00:00:00');
-      if (rangeDays <= 14) return d.toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
-      if (rangeDays <= 90) return d.toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
-      return d.toLocaleDateString('en-US', { month: 'short', year: '2-digit' });
+    // Determine label format based on date range. Labels show the UTC
+    // calendar date, so build a local date with the same fields.
+    const rangeDays = lastDay - firstDay;
+    const formatter = rangeDays <= 90 ? DATE_FORMATS.short : DATE_FORMATS.monthYear;
+    const formatDay = (day) => {
+      const utc = new Date(day * 86400000);
+      return formatter.format(new Date(utc.getUTCFullYear(), utc.getUTCMonth(), utc.getUTCDate()));
     };
 
     this._temporalChart = new Chart(ctx, {
       type: 'line',
       data: {
-        labels: labels.map(formatDate),
+        labels: days.map(formatDay),
         datasets: [{
           label: 'Posts',
           data: values,
@@ -835,21 +939,9 @@ const ThreshApp = {
     this._startAiProgress(statusEl, 45);
 
     try {
-      // Compute word frequency for the report
-      const wordFreq = this._computeWordFreq(collection.posts);
-
-      // Compute summary stats
-      const posts = collection.posts;
-      const avgScore = posts.length ? Math.round(posts.reduce((s, p) => s + p.score, 0) / posts.length) : 0;
-      const avgComments = posts.length ? Math.round(posts.reduce((s, p) => s + p.num_comments, 0) / posts.length) : 0;
-      const dateRange = posts.length ? this._dateRange(posts) : 'N/A';
-
-      const stats = {
-        postCount: posts.length,
-        avgScore,
-        avgComments,
-        dateRange,
-      };
+      // Compute word frequency and summary stats for the report
+      const wordFreq = this._computeWordFreq(collection.posts).top;
+      const stats = this._computeStats(collection.posts);
 
       const result = await ClaudeClient.generateReport({
         posts: collection.posts,
@@ -879,32 +971,65 @@ const ThreshApp = {
     }
   },
 
+  // Word frequencies per posts array. Stored collections never change, so a
+  // result stays valid for as long as its collection is loaded.
+  _wordFreqCache: new WeakMap(),
+
+  /**
+   * Top 20 words across post titles and bodies, stopwords removed.
+   * Shared by the Winnow table and the research report.
+   * Returns { top: [[word, count], ...], totalWords }.
+   */
   _computeWordFreq(posts) {
-    const stopwords = new Set([
-      'the','be','to','of','and','a','in','that','have','i','it','for','not','on','with',
-      'he','as','you','do','at','this','but','his','by','from','they','we','her','she','or',
-      'an','will','my','one','all','would','there','their','what','so','up','out','if','about',
-      'who','get','which','go','me','when','make','can','like','time','no','just','him','know',
-      'take','people','into','year','your','good','some','could','them','see','other','than',
-      'then','now','look','only','come','its','over','think','also','back','after','use','two',
-      'how','our','work','first','well','way','even','new','want','because','any','these',
-      'give','day','most','us','been','has','had','was','were','are','is','am','im','dont',
-      'really','much','very','more','still','should','did','got','going','being','been','may',
-      'own','through','too','does','need','say','each','tell','why','ask','men','ran','try',
-      'every','where','between','never','another','while','last','might','found','before',
-      'same','made','long','right','said','many','thing','things','something','anything','man',
-      'woman','life','world','let','keep','being','down','over','such','against','here','both',
-      'those','put','went','came','off','around','since','still','set','few','without',
-      'already','sure','nothing','point','someone','everyone','everything','lot','feel',
-      'felt','actually','doing','done','went','thought','getting','making','big','put','old',
-      'great','around','little','part','every','again','change','went','says','http','https',
-      'www','com','reddit','removed','deleted',
-    ]);
-    const allText = posts.map(p => `${p.title} ${p.selftext || ''}`).join(' ').toLowerCase();
-    const words = allText.replace(/[^a-z\s]/g, ' ').split(/\s+/).filter(w => w.length > 2 && !stopwords.has(w));
-    const freq = {};
-    words.forEach(w => { freq[w] = (freq[w] || 0) + 1; });
-    return Object.entries(freq).sort((a, b) => b[1] - a[1]).slice(0, 20);
+    let result = this._wordFreqCache.get(posts);
+    if (!result) {
+      result = this._countWords(posts);
+      this._wordFreqCache.set(posts, result);
+    }
+    return result;
+  },
+
+  _countWords(posts) {
+    // Tokenize one post at a time rather than joining the whole collection
+    // into a single string first, counting each word as it is matched.
+
+    // A Map, not a plain object: words like "constructor" would otherwise
+    // collide with Object.prototype members.
+    const freq = new Map();
+    let totalWords = 0;
+    for (const p of posts) {
+      const text = `${p.title} ${p.selftext || ''}`.toLowerCase();
+      WORD_RE.lastIndex = 0;
+      let m;
+      while ((m = WORD_RE.exec(text)) !== null) {
+        const w = m[0];
+        if (w.length <= 2 || STOPWORDS.has(w)) continue;
+        freq.set(w, (freq.get(w) || 0) + 1);
+        totalWords++;
+      }
+    }
+    return {
+      top: this._topEntries(freq, 20),
+      totalWords,
+    };
+  },
+
+  /**
+   * The n highest-count [key, count] entries of a Map, highest first.
+   * Keeps a small sorted window instead of sorting the whole vocabulary;
+   * ties stay in insertion order, as with a stable sort.
+   */
+  _topEntries(counts, n) {
+    const top = [];
+    for (const entry of counts) {
+      const count = entry[1];
+      if (top.length === n && count <= top[n - 1][1]) continue;
+      let i = top.length;
+      while (i > 0 && top[i - 1][1] < count) i--;
+      top.splice(i, 0, entry);
+      if (top.length > n) top.pop();
+    }
+    return top;
   },
 
   _lastReport: '',
@@ -1380,26 +1505,22 @@ const ThreshApp = {
       blockedMsg.style.display = 'block';
       countdown.textContent = `Cooldown: ${status.blockSecondsLeft}s`;
 
-      // Start countdown timer if not already running
+      // Tick the countdown text; RateLimiter notifies when the block ends
       if (!this._countdownInterval) {
         this._countdownInterval = setInterval(() => {
-          const s = RateLimiter.getStatus();
-          if (!s.blocked) {
-            blockedMsg.style.display = 'none';
-            clearInterval(this._countdownInterval);
-            this._countdownInterval = null;
-            this._updateRateSentinel(s);
-
-            // Re-enable the thresh button
-            const submitBtn = document.getElementById('thresh-submit');
-            if (submitBtn) submitBtn.disabled = false;
-          } else {
-            countdown.textContent = `Cooldown: ${s.blockSecondsLeft}s`;
-          }
+          countdown.textContent = `Cooldown: ${RateLimiter.blockSecondsLeft()}s`;
         }, 1000);
       }
-    } else if (blockedMsg) {
-      blockedMsg.style.display = 'none';
+    } else {
+      if (blockedMsg) blockedMsg.style.display = 'none';
+
+      // Block just ended: stop the countdown and re-enable the thresh button
+      if (this._countdownInterval) {
+        clearInterval(this._countdownInterval);
+        this._countdownInterval = null;
+        const submitBtn = document.getElementById('thresh-submit');
+        if (submitBtn) submitBtn.disabled = false;
+      }
     }
   },
 
@@ -1431,25 +1552,34 @@ const ThreshApp = {
   // --- Persistence ---
 
   _saveCollections() {
-    try {
-      // Only save essential data (posts can be large)
-      const toSave = this.collections.map(c => ({
-        id: c.id,
-        posts: c.posts,
-        comments: c.comments || [],
-        config: c.config,
-        timestamp: c.timestamp,
-      }));
-      localStorage.setItem('thresh_collections', JSON.stringify(toSave));
-    } catch (e) {
-      // localStorage might be full
-      if (e.name === 'QuotaExceededError') {
-        this.toast('Storage full. Older collections may be removed.', 'warning');
-        // Remove oldest collection and try again
-        if (this.collections.length > 1) {
-          this.collections.shift();
-          this._saveCollections();
+    // Only save essential data (posts can be large). Each collection is
+    // serialized once, so dropping one on a full quota doesn't mean
+    // re-stringifying all the others.
+    const parts = this.collections.map(c => JSON.stringify({
+      id: c.id,
+      posts: c.posts,
+      comments: c.comments || [],
+      config: c.config,
+      timestamp: c.timestamp,
+      postsFetchedAt: c.postsFetchedAt,
+    }));
+
+    let warned = false;
+    for (;;) {
+      try {
+        localStorage.setItem('thresh_collections', `[${parts.join(',')}]`);
+        return;
+      } catch (e) {
+        // localStorage might be full
+        if (e.name !== 'QuotaExceededError') return;
+        if (!warned) {
+          this.toast('Storage full. Older collections may be removed.', 'warning');
+          warned = true;
         }
+        // Remove oldest collection and try again
+        if (this.collections.length <= 1) return;
+        this.collections.shift();
+        parts.shift();
       }
     }
   },
@@ -1459,6 +1589,11 @@ const ThreshApp = {
       const saved = localStorage.getItem('thresh_collections');
       if (saved) {
         this.collections = JSON.parse(saved);
+        // Older saves also kept each post's comments on the post itself,
+        // duplicating the flat comments list; drop that copy.
+        for (const c of this.collections) {
+          for (const p of c.posts) delete p.fetched_comments;
+        }
       }
     } catch {
       this.collections = [];
@@ -1467,17 +1602,29 @@ const ThreshApp = {
 
   // --- UI Helpers ---
 
+  // Option labels per collection. Collections never change once stored, so
+  // the three selects and every page render share one label per collection.
+  _collectionLabels: new WeakMap(),
+
+  _collectionLabel(c) {
+    let label = this._collectionLabels.get(c);
+    if (label === undefined) {
+      const date = DATE_FORMATS.short.format(new Date(c.timestamp));
+      label = `r/${c.config.subreddit} — ${c.posts.length} posts (${date})`;
+      this._collectionLabels.set(c, label);
+    }
+    return label;
+  },
+
   _populateCollectionSelect(select) {
     if (!select) return;
     const currentVal = select.value;
     select.innerHTML = '<option value="">Select a collection...</option>';
 
     this.collections.forEach(c => {
-      const date = new Date(c.timestamp).toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
-      const label = `r/${c.config.subreddit} — ${c.posts.length} posts (${date})`;
       const opt = document.createElement('option');
       opt.value = c.id;
-      opt.textContent = label;
+      opt.textContent = this._collectionLabel(c);
       select.appendChild(opt);
     });
 
@@ -1491,10 +1638,19 @@ const ThreshApp = {
     });
   },
 
+  // Identifies the collection list last rendered into the Floor, so
+  // navigating back to it skips rebuilding identical markup.
+  _floorRecentKey: null,
+
   _updateFloorRecent() {
     const el = document.getElementById('floor-recent');
     if (!el) return;
 
+    const last = this.collections[this.collections.length - 1];
+    const key = `${this.collections.length}:${last ? last.id : ''}`;
+    if (key === this._floorRecentKey) return;
+    this._floorRecentKey = key;
+
     if (this.collections.length === 0) {
       el.innerHTML = '<p class="text-ash text-sm">No collections yet. Start by threshing a subreddit.</p>';
       return;
@@ -1502,7 +1658,7 @@ const ThreshApp = {
 
     const recent = this.collections.slice(-5).reverse();
     el.innerHTML = recent.map(c => {
-      const date = new Date(c.timestamp).toLocaleDateString('en-US', { month: 'short', day: 'numeric', hour: '2-digit', minute: '2-digit' });
+      const date = DATE_FORMATS.dateTime.format(new Date(c.timestamp));
       return `
         <div style="display:flex;justify-content:space-between;align-items:center;padding:0.5rem 0;border-bottom:1px solid var(--smoke);">
           <div>
@@ -1515,19 +1671,53 @@ const ThreshApp = {
     }).join('');
   },
 
-  _dateRange(posts) {
-    if (!posts.length) return 'N/A';
-    const dates = posts.map(p => p.created_utc).sort();
-    const earliest = new Date(dates[0] * 1000).toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
-    const latest = new Date(dates[dates.length - 1] * 1000).toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
+  // Summary stats per posts array, memoized like word frequencies
+  _statsCache: new WeakMap(),
+
+  /**
+   * Summary statistics shared by the Harvest header and the research report.
+   * Sums and the date range are gathered in a single pass over the posts.
+   */
+  _computeStats(posts) {
+    let stats = this._statsCache.get(posts);
+    if (!stats) {
+      stats = this._summarize(posts);
+      this._statsCache.set(posts, stats);
+    }
+    return stats;
+  },
+
+  _summarize(posts) {
+    if (!posts.length) {
+      return { postCount: 0, avgScore: 0, avgComments: 0, dateRange: 'N/A' };
+    }
+    let scoreSum = 0;
+    let commentSum = 0;
+    let min = Infinity;
+    let max = -Infinity;
+    for (const p of posts) {
+      scoreSum += p.score;
+      commentSum += p.num_comments;
+      if (p.created_utc < min) min = p.created_utc;
+      if (p.created_utc > max) max = p.created_utc;
+    }
+    return {
+      postCount: posts.length,
+      avgScore: Math.round(scoreSum / posts.length),
+      avgComments: Math.round(commentSum / posts.length),
+      dateRange: this._formatDateRange(min, max),
+    };
+  },
+
+  _formatDateRange(minUtc, maxUtc) {
+    const earliest = DATE_FORMATS.short.format(minUtc * 1000);
+    const latest = DATE_FORMATS.short.format(maxUtc * 1000);
     return earliest === latest ? earliest : `${earliest} — ${latest}`;
   },
 
   _escapeHtml(str) {
     if (!str) return '';
-    const div = document.createElement('div');
-    div.textContent = str;
-    return div.innerHTML;
+    return String(str).replace(HTML_ESCAPE_RE, ch => HTML_ESCAPES[ch]);
   },
 };
 
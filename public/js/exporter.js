@@ -3,6 +3,10 @@
  * Generates CSV, JSON, and provenance.txt, bundled into a ZIP.
  */
 
+// A CSV field needs quoting if it holds a quote, comma or line break.
+// One scan instead of four includes() calls per field.
+const CSV_NEEDS_QUOTES = /[",\r\n]/;
+
 const Exporter = {
   /**
    * Export collection data as a downloadable ZIP.
@@ -13,28 +17,36 @@ const Exporter = {
     const { format = 'csv', anonymize = true } = options;
     const { posts, comments, config, timestamp } = collection;
 
-    // Prepare post data
-    let exportPosts = posts.map(p => this._flattenPost(p, anonymize));
+    // Pseudonyms for this export only, so real usernames aren't kept around
+    // after it finishes
+    const aliases = new Map();
+    const flattenPost = p => this._flattenPost(p, anonymize, aliases);
+    const flattenComment = c => this._flattenComment(c, anonymize, aliases);
+
+    // One timestamp for the folder name and the provenance record, so the
+    // two can't disagree if an export straddles midnight UTC
+    const exportedAt = new Date().toISOString();
 
     // Generate provenance
-    const provenance = this._generateProvenance(collection, options);
+    const provenance = this._generateProvenance(collection, options, exportedAt);
 
     // Create ZIP
     const zip = new JSZip();
-    const folderName = `thresh_${config.subreddit.replace(/,/g, '_')}_${this._dateStamp()}`;
+    const folderName = `thresh_${config.subreddit.replace(/,/g, '_')}_${this._dateStamp(exportedAt)}`;
     const folder = zip.folder(folderName);
 
+    // Files are handed to JSZip as Blobs assembled from per-row strings, so
+    // a large collection never exists as one concatenated string in memory.
+    // Rows are flattened as they are serialized rather than up front.
     if (format === 'csv') {
-      folder.file('posts.csv', this._toCSV(exportPosts));
+      folder.file('posts.csv', new Blob(this._csvParts(posts, flattenPost), { type: 'text/csv' }));
       if (comments && comments.length > 0) {
-        const exportComments = comments.map(c => this._flattenComment(c, anonymize));
-        folder.file('comments.csv', this._toCSV(exportComments));
+        folder.file('comments.csv', new Blob(this._csvParts(comments, flattenComment), { type: 'text/csv' }));
       }
     } else {
-      folder.file('posts.json', JSON.stringify(exportPosts, null, 2));
+      folder.file('posts.json', new Blob(this._jsonParts(posts, flattenPost), { type: 'application/json' }));
       if (comments && comments.length > 0) {
-        const exportComments = comments.map(c => this._flattenComment(c, anonymize));
-        folder.file('comments.json', JSON.stringify(exportComments, null, 2));
+        folder.file('comments.json', new Blob(this._jsonParts(comments, flattenComment), { type: 'application/json' }));
       }
     }
 
@@ -51,7 +63,8 @@ const Exporter = {
   preview(collection, options = {}) {
     const { format = 'csv', anonymize = true } = options;
     const { posts } = collection;
-    const sample = posts.slice(0, 5).map(p => this._flattenPost(p, anonymize));
+    const aliases = new Map();
+    const sample = posts.slice(0, 5).map(p => this._flattenPost(p, anonymize, aliases));
 
     if (format === 'csv') {
       return this._toCSV(sample);
@@ -62,12 +75,12 @@ const Exporter = {
   /**
    * Flatten a post object for export.
    */
-  _flattenPost(post, anonymize) {
+  _flattenPost(post, anonymize, aliases) {
     const flat = {
       id: post.id,
       subreddit: post.subreddit,
       title: post.title,
-      author: anonymize ? this._anonymize(post.author) : post.author,
+      author: anonymize ? this._anonymize(post.author, aliases) : post.author,
       selftext: post.selftext,
       score: post.score,
       upvote_ratio: post.upvote_ratio,
@@ -86,11 +99,11 @@ const Exporter = {
   /**
    * Flatten a comment for export.
    */
-  _flattenComment(comment, anonymize) {
+  _flattenComment(comment, anonymize, aliases) {
     return {
       id: comment.id,
       post_id: comment.post_id || '',
-      author: anonymize ? this._anonymize(comment.author) : comment.author,
+      author: anonymize ? this._anonymize(comment.author, aliases) : comment.author,
       body: comment.body,
       score: comment.score,
       created_utc: comment.created_utc,
@@ -103,8 +116,8 @@ const Exporter = {
   /**
    * Generate provenance document.
    */
-  _generateProvenance(collection, options) {
-    const { config, posts, comments, timestamp } = collection;
+  _generateProvenance(collection, options, exportedAt = new Date().toISOString()) {
+    const { config, posts, comments, timestamp, postsFetchedAt } = collection;
     const { format = 'csv', anonymize = true } = options;
 
     const lines = [
@@ -130,11 +143,13 @@ const Exporter = {
       `  Posts collected: ${posts.length}`,
       `  Comments collected: ${comments ? comments.length : 0}`,
       `  Collection timestamp (UTC): ${timestamp}`,
+      // Collections saved before this field existed don't have it
+      ...(postsFetchedAt ? [`  Posts fetched from Reddit (UTC): ${postsFetchedAt}`] : []),
       '',
       'EXPORT',
       `  Format: ${format.toUpperCase()}`,
       `  Authors anonymized: ${anonymize ? 'yes' : 'no'}`,
-      `  Export timestamp (UTC): ${new Date().toISOString()}`,
+      `  Export timestamp (UTC): ${exportedAt}`,
       '',
       'DATA SOURCE',
       `  Endpoint: https://www.reddit.com/r/{subreddit}/{sort}.json`,
@@ -167,33 +182,64 @@ const Exporter = {
    * Convert array of objects to CSV string (UTF-8 BOM for Excel).
    */
   _toCSV(rows) {
-    if (!rows.length) return '';
+    return this._csvParts(rows).join('');
+  },
 
-    const headers = Object.keys(rows[0]);
+  /**
+   * CSV as one string per line, ready to pass to a Blob. Joined, the parts
+   * equal _toCSV's output. toRow maps each item to its flat row.
+   */
+  _csvParts(items, toRow = row => row) {
+    if (!items.length) return [];
+
+    const headers = Object.keys(toRow(items[0]));
     const BOM = '\uFEFF';
 
     const escape = (val) => {
       if (val === null || val === undefined) return '';
       const str = String(val);
-      if (str.includes('"') || str.includes(',') || str.includes('\n') || str.includes('\r')) {
+      if (CSV_NEEDS_QUOTES.test(str)) {
         return '"' + str.replace(/"/g, '""') + '"';
       }
       return str;
     };
 
-    const csvRows = [
-      headers.map(escape).join(','),
-      ...rows.map(row => headers.map(h => escape(row[h])).join(',')),
-    ];
+    const parts = [BOM + headers.map(escape).join(',')];
+    for (const item of items) {
+      const row = toRow(item);
+      parts.push('\r\n' + headers.map(h => escape(row[h])).join(','));
+    }
+    return parts;
+  },
+
+  /**
+   * JSON array as one string per element, matching
+   * JSON.stringify(items.map(toRow), null, 2) once joined.
+   */
+  _jsonParts(items, toRow = row => row) {
+    if (!items.length) return ['[]'];
 
-    return BOM + csvRows.join('\r\n');
+    const parts = ['['];
+    items.forEach((item, i) => {
+      // Nested lines gain one indent level inside the array. String values
+      // never contain raw newlines, since JSON escapes them.
+      const json = JSON.stringify(toRow(item), null, 2).replace(/\n/g, '\n  ');
+      parts.push(`${i ? ',' : ''}\n  ${json}`);
+    });
+    parts.push('\n]');
+    return parts;
   },
 
   /**
-   * Anonymize a username.
+   * Anonymize a username. The hash is deterministic, and the same authors
+   * recur across posts and comments, so aliases (one Map per export) lets
+   * each name be hashed once.
    */
-  _anonymize(username) {
+  _anonymize(username, aliases) {
     if (!username || username === '[deleted]') return '[deleted]';
+    let alias = aliases.get(username);
+    if (alias !== undefined) return alias;
+
     // Simple hash-based anonymization
     let hash = 0;
     for (let i = 0; i < username.length; i++) {
@@ -201,14 +247,16 @@ const Exporter = {
       hash = ((hash << 5) - hash) + char;
       hash = hash & hash; // Convert to 32-bit integer
     }
-    return `user_${Math.abs(hash).toString(36).slice(0, 8)}`;
+    alias = `user_${Math.abs(hash).toString(36).slice(0, 8)}`;
+    aliases.set(username, alias);
+    return alias;
   },
 
   /**
-   * Generate a datestamp for filenames.
+   * Generate a datestamp for filenames from an ISO timestamp (default: now).
    */
-  _dateStamp() {
-    return new Date().toISOString().slice(0, 10).replace(/-/g, '');
+  _dateStamp(iso = new Date().toISOString()) {
+    return iso.slice(0, 10).replace(/-/g, '');
   },
 
   /**
@@ -13,6 +13,7 @@
 const RateLimiter = {
   STORAGE_KEY: 'thresh_rate_limit',
   MAX_REQUESTS_PER_MINUTE: 100,
+  PERSIST_DELAY_MS: 1000,  // Coalesce header-driven writes to localStorage
 
   // Internal state
   _remaining: 100,
@@ -22,18 +23,14 @@ const RateLimiter = {
   _blocked: false,     // True when we've hit a 429
   _blockUntil: 0,      // Unix timestamp (ms) when block expires
   _listeners: [],      // UI callbacks
+  _persistTimer: null, // Pending deferred write
+  _resetTimer: null,   // Fires when the quota window resets
+  _unblockTimer: null, // Fires when the block expires
 
   init() {
     try {
       const saved = localStorage.getItem(this.STORAGE_KEY);
-      if (saved) {
-        const state = JSON.parse(saved);
-        this._remaining = state.remaining ?? 100;
-        this._resetAt = state.resetAt ?? 0;
-        this._used = state.used ?? 0;
-        this._lastUpdated = state.lastUpdated ?? 0;
-        this._blockUntil = state.blockUntil ?? 0;
-      }
+      if (saved) this._applySaved(saved);
     } catch { /* fresh state */ }
 
     // If the reset window has passed, restore quota
@@ -46,6 +43,48 @@ const RateLimiter = {
 
     // Check if we're still in a block period
     this._blocked = Date.now() < this._blockUntil;
+    this._scheduleTimers();
+
+    // Flush any deferred write before the page goes away
+    window.addEventListener('pagehide', () => this._flush());
+
+    // Another tab recorded new quota state — adopt it right away so this
+    // tab doesn't spend requests into a cooldown it hasn't seen yet.
+    window.addEventListener('storage', (e) => {
+      if (e.key !== this.STORAGE_KEY || !e.newValue) return;
+      try {
+        this._adoptRemote(e.newValue);
+      } catch { return; }
+      this._blocked = Date.now() < this._blockUntil;
+      this._scheduleTimers();
+      this._notify();
+    });
+  },
+
+  _applySaved(json) {
+    const state = JSON.parse(json);
+    this._remaining = state.remaining ?? 100;
+    this._resetAt = state.resetAt ?? 0;
+    this._used = state.used ?? 0;
+    this._lastUpdated = state.lastUpdated ?? 0;
+    this._blockUntil = state.blockUntil ?? 0;
+  },
+
+  /**
+   * Merge state written by another tab. Header-driven writes are deferred,
+   * so one can land after this tab recorded a 429: keep the later block,
+   * and only take quota figures that are newer than this tab's own.
+   */
+  _adoptRemote(json) {
+    const state = JSON.parse(json);
+    this._blockUntil = Math.max(this._blockUntil, state.blockUntil ?? 0);
+    const lastUpdated = state.lastUpdated ?? 0;
+    if (lastUpdated > this._lastUpdated) {
+      this._remaining = state.remaining ?? 100;
+      this._resetAt = state.resetAt ?? 0;
+      this._used = state.used ?? 0;
+      this._lastUpdated = lastUpdated;
+    }
   },
 
   /**
@@ -68,7 +107,8 @@ const RateLimiter = {
     }
 
     this._lastUpdated = Date.now();
-    this._persist();
+    this._schedulePersist();
+    this._scheduleTimers();
     this._notify();
   },
 
@@ -81,6 +121,7 @@ const RateLimiter = {
     this._blockUntil = Date.now() + blockDuration;
     this._remaining = 0;
     this._persist();
+    this._scheduleTimers();
     this._notify();
   },
 
@@ -91,6 +132,7 @@ const RateLimiter = {
     this._blocked = false;
     this._blockUntil = 0;
     this._persist();
+    this._scheduleTimers();
     this._notify();
   },
 
@@ -147,7 +189,54 @@ const RateLimiter = {
     this._listeners.forEach(fn => fn(status));
   },
 
+  /**
+   * Arm timers for the next quota reset and block expiry, so listeners
+   * hear about both when they happen instead of having to poll.
+   */
+  _scheduleTimers() {
+    clearTimeout(this._resetTimer);
+    clearTimeout(this._unblockTimer);
+    this._resetTimer = null;
+    this._unblockTimer = null;
+
+    const resetIn = this._resetAt * 1000 - Date.now();
+    if (this._resetAt > 0 && resetIn > 0) {
+      // getStatus() restores quota once the reset time has passed
+      this._resetTimer = setTimeout(() => {
+        this._resetTimer = null;
+        this._notify();
+      }, resetIn + 50);
+    }
+
+    const unblockIn = this._blockUntil - Date.now();
+    if (this._blocked && unblockIn > 0) {
+      // isBlocked() clears an expired block and notifies. A timer can fire
+      // a little early, so re-arm if the block hasn't quite ended yet.
+      this._unblockTimer = setTimeout(() => {
+        this._unblockTimer = null;
+        if (this.isBlocked()) this._scheduleTimers();
+      }, unblockIn);
+    }
+  },
+
+  /**
+   * Defer the localStorage write so a burst of responses costs one write
+   * instead of one per request.
+   */
+  _schedulePersist() {
+    if (this._persistTimer) return;
+    this._persistTimer = setTimeout(() => this._flush(), this.PERSIST_DELAY_MS);
+  },
+
+  _flush() {
+    if (this._persistTimer) this._persist();
+  },
+
   _persist() {
+    if (this._persistTimer) {
+      clearTimeout(this._persistTimer);
+      this._persistTimer = null;
+    }
     try {
       localStorage.setItem(this.STORAGE_KEY, JSON.stringify({
         remaining: this._remaining,
@@ -218,11 +307,24 @@ const SubredditCache = {
 };
 
 
+// Listing sorts that take a time window (the `t` parameter)
+const TIME_FILTERED_SORTS = new Set(['top', 'controversial']);
+
+// Listing sorts that churn within a minute, and time windows long enough
+// that a top/controversial listing barely moves over several minutes
+const FAST_SORTS = new Set(['new', 'rising']);
+const STABLE_TIME_FILTERS = new Set(['week', 'month', 'year', 'all']);
+
+// Sorts Reddit's search endpoint accepts; others fall back to relevance
+const SEARCH_SORTS = new Set(['relevance', 'hot', 'top', 'new', 'comments']);
+
 const RedditClient = {
   PROXY_BASE: '/api/reddit',
   MAX_RETRIES: 3,
-  BASE_DELAY_MS: 600,      // Delay between requests (up from 200ms)
-  SUBREDDIT_DELAY_MS: 1000, // Delay between subreddits (up from 500ms)
+  BASE_DELAY_MS: 1000,     // Minimum spacing between request starts (~60/min)
+  COMMENT_CONCURRENCY: 3,   // Comment fetches in flight at once
+
+  _nextSlot: 0,             // Earliest start time (ms) for the next paced request
 
   /**
    * Fetch JSON from Reddit via the proxy.
@@ -233,11 +335,12 @@ const RedditClient = {
    * @returns {Promise<Object>}
    */
   async fetch(path, params = {}) {
+    // Space request starts evenly; waiting here overlaps the previous
+    // response's latency instead of sleeping after it arrives.
+    await this._pace();
+
     // Block if we're in a rate limit cooldown
-    if (RateLimiter.isBlocked()) {
-      const secs = RateLimiter.blockSecondsLeft();
-      throw new Error(`Rate limited by Reddit. Please wait ${secs}s before trying again.`);
-    }
+    if (RateLimiter.isBlocked()) throw this._blockedError();
 
     const url = new URL(this.PROXY_BASE, window.location.origin);
     url.searchParams.set('path', path);
@@ -256,10 +359,7 @@ const RedditClient = {
         await new Promise(r => setTimeout(r, backoff));
 
         // Re-check block status after waiting
-        if (RateLimiter.isBlocked()) {
-          const secs = RateLimiter.blockSecondsLeft();
-          throw new Error(`Rate limited by Reddit. Please wait ${secs}s before trying again.`);
-        }
+        if (RateLimiter.isBlocked()) throw this._blockedError();
       }
 
       const response = await fetch(url.toString());
@@ -295,6 +395,69 @@ const RedditClient = {
     throw lastError || new Error('Rate limited by Reddit. Please wait and try again.');
   },
 
+  LISTING_TTL_MS: 60 * 1000,   // How long a listing response is reused
+  FAST_LISTING_TTL_MS: 30 * 1000,        // new/rising
+  STABLE_LISTING_TTL_MS: 10 * 60 * 1000, // top/controversial, week or longer
+  LISTING_CACHE_MAX: 20,       // Entries kept before expired ones are pruned
+  _listingCache: new Map(),    // path + params -> { posts, after, fetchedAt, expires }
+  _listingInflight: new Map(), // path + params -> pending cache entry
+
+  /**
+   * Fetch and parse a listing, reusing one fetched within the last ttl ms.
+   * Only the parsed posts are cached, and each caller gets its own copies
+   * since collect() annotates them. fetchedAt (ms) is when Reddit actually
+   * served the listing, which is earlier than now on a cache hit.
+   * Identical requests already in flight share one fetch.
+   */
+  async _fetchListing(path, params, ttl = this.LISTING_TTL_MS) {
+    const key = `${path}?${new URLSearchParams(params)}`;
+    let entry = this._listingCache.get(key);
+
+    if (!entry || Date.now() >= entry.expires) {
+      let pending = this._listingInflight.get(key);
+      if (!pending) {
+        pending = this._loadListing(key, path, params, ttl)
+          .finally(() => this._listingInflight.delete(key));
+        this._listingInflight.set(key, pending);
+      }
+      entry = await pending;
+    }
+
+    return {
+      posts: entry.posts.map(p => ({ ...p })),
+      after: entry.after,
+      fetchedAt: entry.fetchedAt,
+    };
+  },
+
+  /** Fetch a listing and store it, parsed, in the listing cache. */
+  async _loadListing(key, path, params, ttl) {
+    const { posts, after } = this._parseListing(await this.fetch(path, params));
+    const fetchedAt = Date.now();
+
+    if (this._listingCache.size >= this.LISTING_CACHE_MAX) {
+      for (const [k, entry] of this._listingCache) {
+        if (fetchedAt >= entry.expires) this._listingCache.delete(k);
+      }
+      // Still full of live entries: drop the oldest
+      if (this._listingCache.size >= this.LISTING_CACHE_MAX) {
+        this._listingCache.delete(this._listingCache.keys().next().value);
+      }
+    }
+    const entry = { posts, after, fetchedAt, expires: fetchedAt + ttl };
+    this._listingCache.set(key, entry);
+    return entry;
+  },
+
+  /**
+   * Error for a request refused during a rate-limit cooldown. Callers match
+   * on the 'Rate limited' prefix.
+   */
+  _blockedError(action = 'trying again') {
+    const secs = RateLimiter.blockSecondsLeft();
+    return new Error(`Rate limited by Reddit. Please wait ${secs}s before ${action}.`);
+  },
+
   /**
    * Get posts from a subreddit.
    */
@@ -302,15 +465,26 @@ const RedditClient = {
     const path = `r/${subreddit}/${sort}`;
     const params = { limit };
 
-    if (['top', 'controversial'].includes(sort)) {
+    if (TIME_FILTERED_SORTS.has(sort)) {
       params.t = timeFilter;
     }
     if (after) {
       params.after = after;
     }
 
-    const data = await this.fetch(path, params);
-    return this._parseListing(data);
+    return this._fetchListing(path, params, this._listingTtl(sort, timeFilter));
+  },
+
+  /**
+   * How long a listing can be reused. Short-window top/controversial
+   * (hour, day) move as fast as hot, so only week and longer get the long TTL.
+   */
+  _listingTtl(sort, timeFilter) {
+    if (FAST_SORTS.has(sort)) return this.FAST_LISTING_TTL_MS;
+    if (TIME_FILTERED_SORTS.has(sort) && STABLE_TIME_FILTERS.has(timeFilter)) {
+      return this.STABLE_LISTING_TTL_MS;
+    }
+    return this.LISTING_TTL_MS;
   },
 
   /**
@@ -321,13 +495,12 @@ const RedditClient = {
     const params = {
       q: query,
       restrict_sr: 'on',
-      sort,
+      sort: SEARCH_SORTS.has(sort) ? sort : 'relevance',
       t: timeFilter,
       limit,
     };
 
-    const data = await this.fetch(path, params);
-    return this._parseListing(data);
+    return this._fetchListing(path, params);
   },
 
   /**
@@ -342,7 +515,7 @@ const RedditClient = {
       return [];
     }
 
-    return this._parseComments(data[1]);
+    return this._parseComments(data[1], postId);
   },
 
   /**
@@ -386,10 +559,7 @@ const RedditClient = {
     } = config;
 
     // Pre-flight: check if we're blocked
-    if (RateLimiter.isBlocked()) {
-      const secs = RateLimiter.blockSecondsLeft();
-      throw new Error(`Rate limited by Reddit. Please wait ${secs} seconds before collecting.`);
-    }
+    if (RateLimiter.isBlocked()) throw this._blockedError('collecting');
 
     // Warn if quota is very low
     const status = RateLimiter.getStatus();
@@ -404,108 +574,201 @@ const RedditClient = {
     }
 
     const subreddits = subreddit.split(',').map(s => s.trim()).filter(Boolean);
+    const progress = { fetched: 0, total: limit * subreddits.length, aborted: false };
+
+    // Subreddits are independent, so collect them side by side. fetch() paces
+    // every request start on one shared schedule, so this overlaps response
+    // latency across subreddits while the rate stays at one per BASE_DELAY_MS.
+    // If one fails the others stop before their next request, and the first
+    // error is only thrown once all of them have stopped, so nothing keeps
+    // spending quota or reporting progress after collect() rejects.
+    let firstError = null;
+    const results = await Promise.all(subreddits.map(sub =>
+      this._collectSubreddit(sub, { sort, timeFilter, limit, keyword, includeComments }, progress, onProgress)
+        .catch(err => {
+          progress.aborted = true;
+          firstError ??= err;
+          return null;
+        })
+    ));
+    if (firstError) throw firstError;
+
+    // Assemble in the order the subreddits were given
     const allPosts = [];
     const allComments = [];
-    let totalFetched = 0;
+    let fetchedAt = Date.now();
+    for (const result of results) {
+      allPosts.push(...result.posts);
+      allComments.push(...result.comments);
+      fetchedAt = Math.min(fetchedAt, result.fetchedAt);
+    }
 
-    for (const sub of subreddits) {
-      onProgress?.({
-        message: `Fetching posts from r/${sub}...`,
-        current: totalFetched,
-        total: limit * subreddits.length,
-      });
+    return {
+      posts: allPosts,
+      comments: allComments,
+      config,
+      timestamp: new Date().toISOString(),
+      // Listings can be reused from the cache, so the posts may predate the
+      // collection; this is when the oldest listing page came from Reddit.
+      postsFetchedAt: new Date(fetchedAt).toISOString(),
+    };
+  },
 
-      // Paginate: Reddit returns max 100 per request, so loop if limit > 100
-      let posts = [];
-      let after = null;
-      let remaining = limit;
-
-      while (remaining > 0) {
-        const pageSize = Math.min(remaining, 100);
-        let result;
-
-        if (keyword) {
-          // searchPosts doesn't support pagination yet — single page only
-          result = await this.searchPosts(sub, keyword, { sort, timeFilter, limit: pageSize });
-          posts.push(...result.posts);
-          break; // Reddit search pagination is unreliable, stop after first page
-        } else {
-          result = await this.getPosts(sub, { sort, timeFilter, limit: pageSize, after });
-          posts.push(...result.posts);
-          after = result.after;
-        }
+  /**
+   * Collect posts (and optionally comments) from one subreddit for collect().
+   * progress is shared across subreddits: each page's new posts are added to
+   * progress.fetched as they arrive, so the overall count only moves forward;
+   * its aborted flag, set when another subreddit fails, ends this one early.
+   */
+  async _collectSubreddit(sub, { sort, timeFilter, limit, keyword, includeComments }, progress, onProgress) {
+    onProgress?.({
+      message: `Fetching posts from r/${sub}...`,
+      current: progress.fetched,
+      total: progress.total,
+    });
+
+    // Paginate: Reddit returns max 100 per request, so loop if limit > 100
+    // Listings can shift between page requests, so a post already seen on an
+    // earlier page may come back; track ids to keep each post once.
+    let posts = [];
+    const seen = new Set();
+    let after = null;
+    let remaining = limit;
+    let fetchedAt = Date.now();  // Oldest listing page used
+
+    while (remaining > 0) {
+      if (progress.aborted) return { posts: [], comments: [] };
+
+      const pageSize = Math.min(remaining, 100);
+      let result;
+
+      if (keyword) {
+        // searchPosts doesn't support pagination yet — single page only
+        result = await this.searchPosts(sub, keyword, { sort, timeFilter, limit: pageSize });
+        fetchedAt = Math.min(fetchedAt, result.fetchedAt);
+        posts.push(...result.posts);
+        progress.fetched += result.posts.length;
+        break; // Reddit search pagination is unreliable, stop after first page
+      } else {
+        result = await this.getPosts(sub, { sort, timeFilter, limit: pageSize, after });
+        fetchedAt = Math.min(fetchedAt, result.fetchedAt);
+        after = result.after;
+      }
 
-        remaining -= result.posts.length;
+      const before = posts.length;
+      for (const post of result.posts) {
+        if (seen.has(post.id)) continue;
+        seen.add(post.id);
+        posts.push(post);
+        progress.fetched++;
+        remaining--;
+      }
 
-        onProgress?.({
-          message: `Fetched ${posts.length}${limit > 100 ? '/' + limit : ''} posts from r/${sub}...`,
-          current: totalFetched + posts.length,
-          total: limit * subreddits.length,
-        });
+      onProgress?.({
+        message: `Fetched ${posts.length}${limit > 100 ? '/' + limit : ''} posts from r/${sub}...`,
+        current: progress.fetched,
+        total: progress.total,
+      });
 
-        // If Reddit returned fewer than requested or no cursor, we've reached the end
-        if (result.posts.length < pageSize || !after) break;
+      // If Reddit returned fewer than requested or no cursor, we've reached the end.
+      // A page of only repeats means the cursor isn't advancing, so stop too.
+      if (result.posts.length < pageSize || !after || posts.length === before) break;
+    }
 
-        // Respectful delay between pages
-        await new Promise(r => setTimeout(r, this.BASE_DELAY_MS));
-      }
+    // Add subreddit field to each post
+    posts.forEach(p => { p.subreddit = sub; });
+
+    onProgress?.({
+      message: `Collected ${posts.length} posts from r/${sub}`,
+      current: progress.fetched,
+      total: progress.total,
+    });
 
-      // Add subreddit field to each post
-      posts.forEach(p => { p.subreddit = sub; });
+    const comments = [];
 
-      totalFetched += posts.length;
-      allPosts.push(...posts);
+    // Collect comments if requested. Several fetches run at once, but
+    // fetch() keeps request starts BASE_DELAY_MS apart, so the rate stays
+    // capped while response latency overlaps the pacing delay.
+    if (includeComments && !progress.aborted) {
+      const fetchedComments = new Map();
+      let fetched = 0;
+      let stopped = false;
 
       onProgress?.({
-        message: `Collected ${posts.length} posts from r/${sub}`,
-        current: totalFetched,
-        total: limit * subreddits.length,
+        message: `Fetching comments for ${posts.length} posts in r/${sub}...`,
+        current: progress.fetched,
+        total: progress.total,
       });
 
-      // Collect comments if requested
-      if (includeComments) {
-        for (let i = 0; i < posts.length; i++) {
-          onProgress?.({
-            message: `Fetching comments for post ${i + 1}/${posts.length} in r/${sub}...`,
-            current: totalFetched,
-            total: limit * subreddits.length,
-          });
-
-          try {
-            const comments = await this.getComments(sub, posts[i].id);
-            posts[i].fetched_comments = comments;
-            allComments.push(...comments.map(c => ({ ...c, post_id: posts[i].id })));
-          } catch (err) {
-            // If rate limited during comment fetching, stop gracefully
-            if (err.message.includes('Rate limited')) {
+      await this._runPool(posts, this.COMMENT_CONCURRENCY, async (post) => {
+        if (stopped || progress.aborted) return;
+
+        try {
+          fetchedComments.set(post.id, await this.getComments(sub, post.id));
+        } catch (err) {
+          // If rate limited during comment fetching, stop gracefully
+          if (err.message.includes('Rate limited')) {
+            if (!stopped) {
+              stopped = true;
               onProgress?.({
-                message: `Rate limited — stopping comment collection. ${allPosts.length} posts saved.`,
-                current: totalFetched,
-                total: limit * subreddits.length,
+                message: `Rate limited — stopping comment collection. ${progress.fetched} posts saved.`,
+                current: progress.fetched,
+                total: progress.total,
               });
-              break;
             }
-            // Other errors: skip this post's comments
-            posts[i].fetched_comments = [];
+            return;
           }
-
-          // Respectful delay between comment fetches
-          await new Promise(r => setTimeout(r, this.BASE_DELAY_MS));
+          // Other errors: skip this post's comments
+          fetchedComments.set(post.id, []);
         }
-      }
 
-      // Delay between subreddits
-      if (subreddits.length > 1) {
-        await new Promise(r => setTimeout(r, this.SUBREDDIT_DELAY_MS));
+        fetched++;
+        onProgress?.({
+          message: `Fetched comments for post ${fetched}/${posts.length} in r/${sub}...`,
+          current: progress.fetched,
+          total: progress.total,
+        });
+      });
+
+      // Keep comments in post order regardless of completion order. They
+      // are stored once, in this flat list; each carries its post_id.
+      for (const post of posts) {
+        const postComments = fetchedComments.get(post.id);
+        if (postComments) comments.push(...postComments);
       }
     }
 
-    return {
-      posts: allPosts,
-      comments: allComments,
-      config,
-      timestamp: new Date().toISOString(),
+    return { posts, comments, fetchedAt };
+  },
+
+  /**
+   * Wait for the next request slot. Slots are spaced BASE_DELAY_MS apart
+   * by start time rather than by completion time. With latency no longer
+   * added on top, BASE_DELAY_MS alone sets the rate: 1000ms gives ~60
+   * requests/min, about what latency + 600ms between requests used to give,
+   * leaving headroom under Reddit's 100/min.
+   */
+  async _pace() {
+    const now = Date.now();
+    const slot = Math.max(now, this._nextSlot);
+    this._nextSlot = slot + this.BASE_DELAY_MS;
+    if (slot > now) {
+      await new Promise(r => setTimeout(r, slot - now));
+    }
+  },
+
+  /**
+   * Run an async worker over items with at most `limit` in flight.
+   */
+  async _runPool(items, limit, worker) {
+    let next = 0;
+    const run = async () => {
+      while (next < items.length) {
+        await worker(items[next++]);
+      }
     };
+    const workers = Array.from({ length: Math.min(limit, items.length) }, run);
+    await Promise.all(workers);
   },
 
   /**
@@ -530,29 +793,30 @@ const RedditClient = {
       return { posts: [], after: null };
     }
 
-    const posts = data.data.children
-      .filter(child => child.kind === 't3')
-      .map(child => {
-        const d = child.data;
-        return {
-          id: d.id,
-          reddit_id: d.name,
-          title: d.title,
-          author: d.author,
-          selftext: d.selftext || '',
-          score: d.score,
-          upvote_ratio: d.upvote_ratio,
-          num_comments: d.num_comments,
-          created_utc: d.created_utc,
-          url: d.url,
-          permalink: `https://reddit.com${d.permalink}`,
-          is_self: d.is_self,
-          link_flair_text: d.link_flair_text || '',
-          subreddit: d.subreddit,
-          domain: d.domain,
-          over_18: d.over_18,
-        };
+    // One pass over the children; no intermediate filtered array
+    const posts = [];
+    for (const child of data.data.children) {
+      if (child.kind !== 't3') continue;
+      const d = child.data;
+      posts.push({
+        id: d.id,
+        reddit_id: d.name,
+        title: d.title,
+        author: d.author,
+        selftext: d.selftext || '',
+        score: d.score,
+        upvote_ratio: d.upvote_ratio,
+        num_comments: d.num_comments,
+        created_utc: d.created_utc,
+        url: d.url,
+        permalink: `https://reddit.com${d.permalink}`,
+        is_self: d.is_self,
+        link_flair_text: d.link_flair_text || '',
+        subreddit: d.subreddit,
+        domain: d.domain,
+        over_18: d.over_18,
       });
+    }
 
     return {
       posts,
@@ -563,7 +827,7 @@ const RedditClient = {
   /**
    * Parse comment listing into flat array.
    */
-  _parseComments(listing) {
+  _parseComments(listing, postId) {
     if (!listing || !listing.data || !listing.data.children) return [];
 
     const comments = [];
@@ -580,6 +844,7 @@ const RedditClient = {
         created_utc: d.created_utc,
         depth,
         parent_id: d.parent_id,
+        post_id: postId,
       });
 
       // Process replies
@@ -18,6 +18,28 @@ const ANTHROPIC_VERSION = '2023-06-01';
 const MODEL = 'claude-opus-4-6';
 const MAX_TOKENS = 8192;
 
+// Health check / info payload — fixed for the life of the worker, so it is
+// serialized once rather than on every probe
+const SERVICE_INFO_BODY = JSON.stringify({
+  service: 'thresh-proxy',
+  description: 'Anthropic API proxy for The Threshing Floor',
+  model: MODEL,
+  status: 'ok',
+});
+
+// Parsed ALLOWED_ORIGINS, shared across requests in this isolate.
+// Keyed on the raw string so a changed binding is re-parsed.
+let allowedOriginsRaw = null;
+let allowedOrigins = null;
+
+function getAllowedOrigins(env) {
+  if (env.ALLOWED_ORIGINS !== allowedOriginsRaw) {
+    allowedOriginsRaw = env.ALLOWED_ORIGINS;
+    allowedOrigins = new Set(allowedOriginsRaw.split(',').map(o => o.trim()));
+  }
+  return allowedOrigins;
+}
+
 /**
  * Build CORS headers. If ALLOWED_ORIGINS is set, validate the request origin.
  * Otherwise, allow all origins (for public research tool use).
@@ -26,8 +48,7 @@ function corsHeaders(request, env) {
   const origin = request.headers.get('Origin') || '*';
 
   if (env.ALLOWED_ORIGINS) {
-    const allowed = env.ALLOWED_ORIGINS.split(',').map(o => o.trim());
-    if (!allowed.includes(origin)) {
+    if (!getAllowedOrigins(env).has(origin)) {
       return null; // Origin not allowed
     }
   }
@@ -113,9 +134,8 @@ async function handlePost(request, env) {
       body: JSON.stringify(anthropicBody),
     });
 
-    const data = await response.json();
-
     if (!response.ok) {
+      const data = await response.json().catch(() => ({}));
       return new Response(
         JSON.stringify({
           error: data.error?.message || 'Anthropic API error',
@@ -125,7 +145,9 @@ async function handlePost(request, env) {
       );
     }
 
-    return new Response(JSON.stringify(data), {
+    // Relay the Messages API body untouched rather than parsing and
+    // re-serializing a response that can run to thousands of tokens.
+    return new Response(await response.text(), {
       status: 200,
       headers,
     });
@@ -152,14 +174,6 @@ export default {
 
     // Health check / info for GET requests
     const headers = corsHeaders(request, env) || { 'Content-Type': 'application/json' };
-    return new Response(
-      JSON.stringify({
-        service: 'thresh-proxy',
-        description: 'Anthropic API proxy for The Threshing Floor',
-        model: MODEL,
-        status: 'ok',
-      }),
-      { status: 200, headers }
-    );
+    return new Response(SERVICE_INFO_BODY, { status: 200, headers });
   },
 };